@@ -2,16 +2,19 @@
 
 import argparse
 import getpass
+import itertools
 import logging
 import os
 import sys
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
 
 import openpyxl
-import pandas as pd
 import psycopg2
-from openpyxl.styles import Border, Color, Font, PatternFill, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Border, Color, Font, NamedStyle, PatternFill, Side
 from openpyxl.utils.cell import get_column_letter
+from psycopg2 import sql as pgsql
+from psycopg2.pool import ThreadedConnectionPool
 
 try:
     from _version import __vdate, __version__
@@ -58,7 +61,6 @@ class Database:
         self.user = user
         self.port = 5432
         self.in_transaction = False
-        self.encoding = "UTF8"
         self.conn = None
         self.get_password()
 
@@ -71,20 +73,40 @@ class Database:
             self.user,
         )
 
-    def __del__(self: "Database") -> None:
-        """Delete the instance."""
+    def __enter__(self: "Database") -> "Database":
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(self: "Database", exc_type, exc_value, traceback) -> None:  # noqa
+        """Close the database connection on exit."""
         self.close()
 
     def get_password(self: "Database") -> None:
-        """Prompt the user to enter the database password."""
+        """Open the database connection, prompting for a password if needed.
+
+        A first connection attempt is made without a password so
+        ~/.pgpass or the PG* environment variables can satisfy
+        authentication silently; the prompt only appears when that
+        attempt is rejected. Whichever attempt succeeds, the connection
+        is kept for the rest of the run; reconnecting per query would
+        cost a TCP and auth roundtrip each time.
+        """
+        self.passwd = None
+        try:
+            self.conn = psycopg2.connect(
+                host=str(self.host),
+                database=str(self.database),
+                port=self.port,
+                user=str(self.user),
+            )
+            return
+        except psycopg2.OperationalError:
+            pass
         self.passwd = getpass.getpass("Enter your password for %s: " % self.__repr__())
         try:
             self.open_db()
-            self.close()
         except psycopg2.OperationalError as error:
             error_handler(error)
-        finally:
-            self.close()
 
     def open_db(self: "Database") -> None:
         """Open a database connection."""
@@ -104,11 +126,19 @@ class Database:
 
         if self.conn is None:
             self.conn = db_conn(self)
-        self.encoding = self.conn.encoding
 
-    def cursor(self: "Database"):  # noqa
-        """Return the connection cursor."""
+    def cursor(self: "Database", name: str = None):  # noqa
+        """Return the connection cursor.
+
+        Args:
+        ----
+            name (str): If given, create a named (server-side) cursor so
+                the result set stays on the server and is fetched in
+                batches of ``itersize`` rows.
+        """
         self.open_db()
+        if name is not None:
+            return self.conn.cursor(name=name)
         return self.conn.cursor()
 
     def close(self: "Database") -> None:
@@ -130,18 +160,25 @@ class Database:
             self.conn.rollback()
         self.in_transaction = False
 
-    def execute(self: "Database", sql: str, params: dict = None):  # noqa
-        """A shortcut to self.cursor().execute() that handles encoding.
-
-        Handles insert, updates, deletes
+    def execute(  # noqa
+        self: "Database",
+        sql: str,
+        params: dict = None,
+        name: str = None,
+    ):
+        """A shortcut to self.cursor().execute().
+
+        Accepts plain strings and psycopg2.sql composables; psycopg2
+        handles the connection encoding itself, so no per-call encode is
+        needed. Handles insert, updates, deletes.
         """
         self.in_transaction = True
         try:
-            curs = self.cursor()
+            curs = self.cursor(name=name)
             if params is None:
-                curs.execute(sql.encode(self.encoding))
+                curs.execute(sql)
             else:
-                curs.execute(sql.encode(self.encoding), params)
+                curs.execute(sql, params)
         except Exception:
             self.rollback()
             raise
@@ -172,90 +209,213 @@ class DataSummary(Database):
         super().__init__(host, database, user)
         self.schema = schema
         self.table = table
-        self.verify_table_object()
-        self.data = self.table_data()[0]
-        self.total_rows = self.table_data()[1]
-        self.df = pd.DataFrame(self.data, columns=self.columns())
-
-    def verify_table_object(self: "DataSummary") -> None:
-        """Check that the table object exists."""
-        curs = self.execute(
-            """
-            SELECT table_schema, table_name
-            FROM information_schema.tables
-            WHERE table_schema = %(schema)s
-            AND table_name = %(table)s;
-            """,
-            {"schema": self.schema, "table": self.table},
-        )
-        if curs.rowcount == 0:
-            error_handler(
-                Exception(f"Table object does not exist: {self.schema}.{self.table}"),
-            )
+        self._cols = self.columns()
+        self.total_rows = self.row_count()
+        self._nunique = {}
+        self._mode = {}
+        self.summarize_all()
 
     def columns(self: "DataSummary") -> list:
-        """List all columns in the table."""
-        cur = self.execute(
-            """
-            SELECT column_name
-            FROM information_schema.columns
-            WHERE table_schema = %(schema)s
-            AND table_name = %(table)s;
-            """,
-            {"schema": self.schema, "table": self.table},
-        )
-        return self.column_rows(cur)
+        """List all columns in the table.
 
-    def unique(self: "DataSummary", col: str) -> tuple[list, int]:
-        """List all unique values in a column."""
-        cur = self.execute(
-            """
-            SELECT distinct "%s"
-            FROM %s.%s
-            WHERE "%s" is not null
-            ORDER BY "%s";
-            """
-            % (col, self.schema, self.table, col, col),
-        )
-        return self.column_rows(cur), cur.rowcount
+        Column names and data types come from one catalog query that
+        doubles as the table existence check: an object with no rows in
+        information_schema.columns does not exist. The result is cached;
+        the table definition cannot change mid-run, so repeat callers
+        skip the catalog query.
+        """
+        if getattr(self, "_cols", None) is None:
+            cur = self.execute(
+                """
+                SELECT column_name,
+                    case
+                        when character_maximum_length is null
+                        then data_type
+                        else data_type || '(' || character_maximum_length || ')'
+                        end as data_type,
+                    is_nullable
+                FROM information_schema.columns
+                WHERE table_schema = %(schema)s
+                AND table_name = %(table)s;
+                """,
+                {"schema": self.schema, "table": self.table},
+            )
+            rows = cur.fetchall()
+            if not rows:
+                error_handler(
+                    Exception(
+                        f"Table object does not exist: {self.schema}.{self.table}",
+                    ),
+                )
+            self._cols = [row[0] for row in rows]
+            self._dtypes = {row[0]: row[1] for row in rows}
+            self._notnull = {row[0] for row in rows if row[2] == "NO"}
+        return self._cols
 
-    def column_rows(self: "DataSummary", cur: str) -> list:
-        """Return a formatted list of records in the cursor.
+    def unique(self: "DataSummary", col: str, sort_unique: bool = False):  # noqa
+        """Yield all unique values in a column, streamed from the server.
 
-        Args
-        ----
-            cur (str): Cursor object.
+        A named (server-side) cursor keeps the result set on the server
+        and fetches ``itersize`` rows at a time, so memory stays bounded
+        no matter how many distinct values the column holds.
 
-        Returns
-        -------
-            list: List of records.
+        Args:
+        ----
+            col (str): Column name.
+            sort_unique (bool): Sort the values server-side. Off by
+                default: without the ORDER BY Postgres can satisfy the
+                DISTINCT with a hash aggregate instead of sort+unique,
+                and the worksheet auto-filter already offers interactive
+                sorting.
         """
-        return [v[0] for v in cur]
+        statement = pgsql.SQL(
+            """
+            SELECT distinct {col}
+            FROM {tbl}
+            WHERE {col} is not null
+            """,
+        ).format(
+            col=pgsql.Identifier(col),
+            tbl=pgsql.Identifier(self.schema, self.table),
+        )
+        if sort_unique:
+            statement += pgsql.SQL("ORDER BY {col}").format(
+                col=pgsql.Identifier(col),
+            )
+        cur = self.execute(
+            statement,
+            name="unique_values_%d" % self._cols.index(col),
+        )
+        cur.itersize = 10000
+        try:
+            for row in cur:
+                yield row[0]
+        finally:
+            cur.close()
 
-    def most_frequent_value(self: "DataSummary", col: str) -> tuple:
-        """Select the most frequent values for a column in a table.
+    def unique_indexed_columns(self: "DataSummary") -> set:
+        """Set of columns covered by a single-column unique index.
 
-        Args
-            col (str): Column to select most frequent values.
+        Only full-table (non-partial), valid indexes count, and only
+        the key column itself — not columns merely INCLUDEd in the
+        index — so the uniqueness guarantee holds for every row.
 
         Returns
         -------
-            tuple: Tuple row object.
+            set: Column names with a one-column unique index.
         """
         cur = self.execute(
             """
-            SELECT "%s", COUNT(*)
-            FROM %s.%s
-            GROUP BY "%s"
-            ORDER BY COUNT DESC;
+            SELECT a.attname
+            FROM pg_index i
+            JOIN pg_attribute a
+                ON a.attrelid = i.indrelid
+                AND a.attnum = i.indkey[0]
+            WHERE i.indisunique
+            AND i.indisvalid
+            AND i.indpred IS NULL
+            AND i.indnkeyatts = 1
+            AND i.indrelid = (
+                SELECT c.oid
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %(schema)s
+                AND c.relname = %(table)s
+            );
+            """,
+            {"schema": self.schema, "table": self.table},
+        )
+        return {row[0] for row in cur.fetchall()}
+
+    def summarize_all(self: "DataSummary") -> None:
+        """Compute summary statistics for every column in one roundtrip.
+
+        Builds one UNION ALL branch per column covering the distinct
+        count, most frequent value, and value frequency. Each branch
+        groups the column once and derives all three statistics from
+        that grouping, so the table is scanned once per column rather
+        than once per statistic. The branches are independent, so they
+        are split across a small connection pool and executed
+        concurrently; the server works on several columns at once while
+        the client overlaps the roundtrips. Results are cached in
+        ``self._nunique`` and ``self._mode`` for use by
+        ``write_summary``.
+
+        Columns backed by a single-column unique index and declared NOT
+        NULL (primary keys, identity columns) are short-circuited: every
+        value is distinct, so the distinct count equals the row count
+        and no value occurs more than once. Those columns skip the scan
+        entirely.
+        """
+        unique_cols = self.unique_indexed_columns() & self._notnull
+        for col in unique_cols:
+            self._nunique[col] = self.total_rows
+            self._mode[col] = (None, 1 if self.total_rows else None)
+        branch = pgsql.SQL(
             """
-            % (col, self.schema, self.table, col),
+            SELECT {name} AS column_name, q.n_unique, q.mode_value, q.mode_freq
+            FROM (
+                WITH grp AS (
+                    SELECT {col} AS val, COUNT(*) AS n
+                    FROM {tbl}
+                    WHERE {col} IS NOT NULL
+                    GROUP BY {col}
+                )
+                SELECT COUNT(val) AS n_unique,
+                    (SELECT val::text FROM grp ORDER BY n DESC LIMIT 1)
+                        AS mode_value,
+                    MAX(n) AS mode_freq
+                FROM grp
+            ) q
+            """,
         )
-        return cur.fetchone()
+        branches = [
+            branch.format(
+                name=pgsql.Literal(col),
+                col=pgsql.Identifier(col),
+                tbl=pgsql.Identifier(self.schema, self.table),
+            )
+            for col in self._cols
+            if col not in unique_cols
+        ]
+        if not branches:
+            return
+        max_workers = min(8, len(branches))
+        batches = [branches[i::max_workers] for i in range(max_workers)]
+        pool = ThreadedConnectionPool(
+            1,
+            max_workers,
+            host=str(self.host),
+            database=str(self.database),
+            port=self.port,
+            user=str(self.user),
+            password=self.passwd,
+        )
+
+        def run_batch(batch: list) -> list:
+            """Run one batch of UNION ALL branches on a pooled connection."""
+            conn = pool.getconn()
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(pgsql.SQL(" UNION ALL ").join(batch))
+                    return cur.fetchall()
+            finally:
+                pool.putconn(conn)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for rows in executor.map(run_batch, batches):
+                    for col, n_unique, mode_value, mode_freq in rows:
+                        self._nunique[col] = n_unique
+                        self._mode[col] = (mode_value, mode_freq)
+        finally:
+            pool.closeall()
 
     def column_dtype(self: "DataSummary", col: str) -> str:
         """Get the data type for a column in a table.
 
+        Served from the metadata cached by ``columns()``; no extra query.
+
         Args
         ----
             col (str): Column name.
@@ -264,40 +424,22 @@ class DataSummary(Database):
         -------
             str: Data type for the column.
         """
-        cur = self.execute(
-            """SELECT
-                    column_name,
-                    case
-                        when character_maximum_length is null
-                        then data_type
-                        else data_type || '(' || character_maximum_length || ')'
-                        end as data_type
-                FROM information_schema.columns
-                WHERE table_schema = %(schema)s
-                  AND table_name = %(table)s
-                  AND column_name = %(col)s;
-            """,
-            {"col": col, "schema": self.schema, "table": self.table},
-        )
-        return cur.fetchone()[1]
+        self.columns()
+        return self._dtypes[col]
 
-    def table_data(self: "DataSummary") -> tuple[Any, int]:
-        """Select all table data and number of rows in the table.
+    def row_count(self: "DataSummary") -> int:
+        """Count the total number of rows in the table.
 
         Returns
         -------
-            tuple: Tuple of data rows and the number of total rows.
+            int: Number of rows in the table.
         """
-        try:
-            cur = self.execute(
-                """
-                SELECT * FROM %s.%s;
-                """
-                % (self.schema, self.table),
-            )
-        except Exception as error:
-            error_handler(error)
-        return cur.fetchall(), cur.rowcount
+        cur = self.execute(
+            pgsql.SQL("SELECT COUNT(*) FROM {tbl};").format(
+                tbl=pgsql.Identifier(self.schema, self.table),
+            ),
+        )
+        return cur.fetchone()[0]
 
 
 def clparser() -> argparse.ArgumentParser:
@@ -347,18 +489,23 @@ def clparser() -> argparse.ArgumentParser:
 
 
 def write_summary(data: "DataSummary", ofile: str) -> None:
-    """Write results to an output file."""
+    """Write results to an output file.
+
+    The workbook is opened in write-only mode so rows are flushed to
+    disk as they are appended instead of being held as Cell objects in
+    memory.
+    """
     try:
         if os.path.exists(ofile):
             os.remove(ofile)
     except OSError as error:
         error_handler(error)
 
-    wkb = openpyxl.Workbook()
-    sheet = wkb.active
-    sheet.title = "Data Summary"
+    wkb = openpyxl.Workbook(write_only=True)
+    sheet = wkb.create_sheet("Data Summary")
 
-    # Excel styling
+    # Excel styling. Styles are registered once as NamedStyles so each
+    # styled cell stores a reference instead of a per-cell style copy.
     font = Font(bold=True, size=12)
     fill = PatternFill(patternType="solid", fgColor=Color("97b4c9"))
     border_all = Border(
@@ -367,68 +514,61 @@ def write_summary(data: "DataSummary", ofile: str) -> None:
         top=Side(border_style="thin", color=Color("000000")),
         bottom=Side(border_style="thin", color=Color("000000")),
     )
+    wkb.add_named_style(NamedStyle(name="summary_label", font=font))
+    wkb.add_named_style(
+        NamedStyle(name="summary_column", font=font, fill=fill, border=border_all),
+    )
 
-    # Summary header
-    sheet.cell(row=1, column=2).value = "Host"
-    sheet.cell(row=1, column=2).font = font
-    sheet.cell(row=2, column=2).value = data.host
-
-    sheet.cell(row=1, column=3).value = "Database"
-    sheet.cell(row=1, column=3).font = font
-    sheet.cell(row=2, column=3).value = data.database
-
-    sheet.cell(row=1, column=4).value = "Schema"
-    sheet.cell(row=1, column=4).font = font
-    sheet.cell(row=2, column=4).value = data.schema
+    def label_cell(value: str) -> WriteOnlyCell:
+        """Return a bolded header cell."""
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.style = "summary_label"
+        return cell
 
-    sheet.cell(row=1, column=5).value = "Table"
-    sheet.cell(row=1, column=5).font = font
-    sheet.cell(row=2, column=5).value = data.table
+    def column_cell(value: str) -> WriteOnlyCell:
+        """Return a styled column-name cell."""
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.style = "summary_column"
+        return cell
 
-    sheet.cell(row=1, column=6).value = "Total Rows"
-    sheet.cell(row=1, column=6).font = font
-    sheet.cell(row=2, column=6).value = data.total_rows
+    # Sheet properties must be set before the first append in
+    # write-only mode.
+    cols = data.columns()
+    sheet.column_dimensions["A"].width = 25
+    sheet.auto_filter.ref = f"B8:{get_column_letter(len(cols) + 1)}8"
 
-    sheet.cell(row=1, column=7).value = "Description"
-    sheet.cell(row=1, column=7).font = font
-    sheet.cell(row=2, column=7).value = "Distinct values for each column in a table."
+    # Summary header
+    labels = ["Host", "Database", "Schema", "Table", "Total Rows", "Description"]
+    sheet.append([None] + [label_cell(v) for v in labels])
+    sheet.append(
+        [
+            None,
+            data.host,
+            data.database,
+            data.schema,
+            data.table,
+            data.total_rows,
+            "Distinct values for each column in a table.",
+        ],
+    )
+    sheet.append([])
 
     # Summary results
-    for col in range(len(data.columns())):
-        # column = data.columns()[col]
-        if col == 0:
-            sheet.cell(row=4, column=col + 1).value = "# of unique values"
-            sheet.cell(row=4, column=col + 1).font = font
-            sheet.cell(row=5, column=col + 1).value = "most frequent value"
-            sheet.cell(row=5, column=col + 1).font = font
-            sheet.cell(row=6, column=col + 1).value = "value frequency"
-            sheet.cell(row=6, column=col + 1).font = font
-            sheet.cell(row=7, column=col + 1).value = "data type"
-            sheet.cell(row=7, column=col + 1).font = font
-            sheet.cell(row=8, column=col + 1).value = "column name"
-            sheet.cell(row=8, column=col + 1).font = font
-        # Number of unique values
-        sheet.cell(row=4, column=col + 2).value = data.unique(data.columns()[col])[1]
-        # Most frequent value and frequency
-        val, freq = data.most_frequent_value(data.columns()[col])
-        sheet.cell(row=5, column=col + 2).value = val
-        sheet.cell(row=6, column=col + 2).value = freq
-        # Column data type
-        sheet.cell(row=7, column=col + 2).value = data.column_dtype(data.columns()[col])
-        # Column names
-        sheet.cell(row=8, column=col + 2).value = data.columns()[col]
-        sheet.cell(row=8, column=col + 2).font = font
-        sheet.cell(row=8, column=col + 2).border = border_all
-        sheet.cell(row=8, column=col + 2).fill = fill
-        # Unique column values
-        row = 9
-        for value in data.unique(data.columns()[col])[0]:
-            sheet.cell(row=row, column=col + 2).value = value
-            row += 1
-        # Turn on filter
-        sheet.auto_filter.ref = f"B8:{get_column_letter(len(data.columns()) + 1)}8"
-        # Column A cell width
-        sheet.column_dimensions["A"].width = 25
+    sheet.append(
+        [label_cell("# of unique values")] + [data._nunique[c] for c in cols],
+    )
+    modes = [data._mode[c] for c in cols]
+    sheet.append([label_cell("most frequent value")] + [m[0] for m in modes])
+    sheet.append([label_cell("value frequency")] + [m[1] for m in modes])
+    sheet.append([label_cell("data type")] + [data.column_dtype(c) for c in cols])
+    sheet.append([label_cell("column name")] + [column_cell(c) for c in cols])
+
+    # Unique column values. zip_longest pulls one value per column from
+    # each streaming cursor, so whole rows are appended without ever
+    # buffering a full distinct-value list in memory.
+    value_streams = [data.unique(c) for c in cols]
+    for values in itertools.zip_longest(*value_streams):
+        sheet.append([None, *values])
 
     wkb.save(ofile)
 
@@ -460,8 +600,8 @@ def tbl_summary(
     if os.path.splitext(output_file)[-1] not in [".xlsx"]:
         error_handler(Exception(f"File extension not valid: {output_file}"))
 
-    data = DataSummary(host, user, database, schema, table)
-    write_summary(data, output_file)
+    with DataSummary(host, user, database, schema, table) as data:
+        write_summary(data, output_file)
     logger.info(f"Results saved to {output_file}")
 
 